@@ -11,14 +11,14 @@ Modules:
 - Flask: For creating and running the web application.
 - render_template, request: From Flask, for rendering templates and handling
 requests.
-- Grades, StudentManager: Custom modules for handling student data operations
+- StudentManager: Custom module for handling student data operations
 and calculations.
 """
 
 import sqlite3
 
 from flask import Flask, render_template, request
-from student import Grades, StudentManager
+from student import StudentManager
 
 app = Flask(__name__, template_folder="frontend")
 
@@ -27,6 +27,19 @@ student_manager = StudentManager(database_path)
 student_filename = "student.tsv"
 student_manager.parse_data(student_filename)
 
+# Error pages with fixed text are rendered once at startup instead of
+# going through Jinja on every failed request.
+with app.test_request_context():
+    STUDENT_NOT_FOUND_PAGE = render_template(
+        "home.html", error_message="Student not found"
+    )
+    UPDATE_FAILED_PAGE = render_template(
+        "home.html", error_message="Update failed."
+    )
+    DELETE_FAILED_PAGE = render_template(
+        "home.html", error_message="Failed to delete the student."
+    )
+
 
 @app.route("/")
 def home():
@@ -38,35 +51,30 @@ def home():
 def show_student():
     """Display student information or an error message."""
     student_id = request.form.get("student_id")
-    with student_manager.connect() as conn:
-        student_info = student_manager.get_student_by_id(student_id)
-        if student_info:
-            scores = {
-                "math_max": Grades.get_max_score(conn, "Math"),
-                "math_min": Grades.get_min_score(conn, "Math"),
-                "math_avg": Grades.get_avg_score(conn, "Math"),
-            }
-            scores = {
-                "English_max": Grades.get_max_score(conn, "English"),
-                "English_min": Grades.get_min_score(conn, "English"),
-                "English_avg": Grades.get_avg_score(conn, "English"),
-                "math_max": Grades.get_max_score(conn, "Math"),
-                "math_min": Grades.get_min_score(conn, "Math"),
-                "math_avg": Grades.get_avg_score(conn, "Math"),
-                "History_max": Grades.get_max_score(conn, "History"),
-                "History_min": Grades.get_min_score(conn, "History"),
-                "History_avg": Grades.get_avg_score(conn, "History"),
-                "Science_max": Grades.get_max_score(conn, "Science"),
-                "Science_min": Grades.get_min_score(conn, "Science"),
-                "Science_avg": Grades.get_avg_score(conn, "Science"),
-                "Arts_max": Grades.get_max_score(conn, "Arts"),
-                "Arts_min": Grades.get_min_score(conn, "Arts"),
-                "Arts_avg": Grades.get_avg_score(conn, "Arts"),
-            }
-        else:
-            return render_template(
-                "home.html", error_message="Student not found"
-            )
+    student_info = student_manager.get_student_by_id(student_id)
+    if not student_info:
+        return STUDENT_NOT_FOUND_PAGE
+
+    # One SQL statement for all fifteen aggregates instead of fifteen
+    # separate Grades.get_* queries.
+    stats = student_manager.get_all_subject_stats()
+    scores = {
+        "English_max": stats["English"]["max"],
+        "English_min": stats["English"]["min"],
+        "English_avg": stats["English"]["avg"],
+        "math_max": stats["Math"]["max"],
+        "math_min": stats["Math"]["min"],
+        "math_avg": stats["Math"]["avg"],
+        "History_max": stats["History"]["max"],
+        "History_min": stats["History"]["min"],
+        "History_avg": stats["History"]["avg"],
+        "Science_max": stats["Science"]["max"],
+        "Science_min": stats["Science"]["min"],
+        "Science_avg": stats["Science"]["avg"],
+        "Arts_max": stats["Arts"]["max"],
+        "Arts_min": stats["Arts"]["min"],
+        "Arts_avg": stats["Arts"]["avg"],
+    }
 
     return render_template(
         "home.html", student_info=student_info, scores=scores
@@ -106,25 +114,20 @@ def update_student(student_id):
     new_value = request.form.get("new_value")
     updates = {field: new_value}
     if student_manager.update_student(student_id, **updates):
-        print("Update successful!")
-        error_message = "Update successful!"
-    else:
-        print("Update failed.")
-        error_message = "Update failed."
-    return render_template("home.html", error_message=error_message)
+        return render_template(
+            "home.html", error_message="Update successful!"
+        )
+    return UPDATE_FAILED_PAGE
 
 
 @app.route("/delete_student/<student_id>", methods=["GET"])
 def delete_student(student_id):
     """Delete a student from the database and display the result."""
     if student_manager.delete_student(student_id):
-        print(f"Student {student_id} successfully deleted.")
         error_message = f"Student {student_id} successfully deleted."
-    else:
-        print("Failed to delete the student.")
-        error_message = "Failed to delete the student."
-    return render_template("home.html", error_message=error_message)
+        return render_template("home.html", error_message=error_message)
+    return DELETE_FAILED_PAGE
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(debug=False)
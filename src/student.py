@@ -20,10 +20,87 @@ institutions.
 
 """
 
+import csv
+import shutil
 import sqlite3
+import subprocess
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is only an optional fast path for ingest
+    pd = None
+
+SUBJECTS = ("English", "Math", "History", "Science", "Arts")
+COLUMNS = ("ID", "Name", "Gender", "Enroll_Date") + SUBJECTS
+
+_SELECT_ALL_SQL = "SELECT " + ", ".join(COLUMNS) + " FROM student"
+_SELECT_ROW_SQL = _SELECT_ALL_SQL + " WHERE ID = ?"
+# Concatenate each row into one tab-separated string inside SQLite so the
+# export loop receives ready-made lines instead of joining nine columns
+# per row in Python. COALESCE keeps a NULL column (possible via partial
+# inserts or updates) from nulling out the whole concatenation.
+_EXPORT_SQL = (
+    "SELECT "
+    + " || char(9) || ".join(f"COALESCE({column}, '')" for column in COLUMNS)
+    + " FROM student"
+)
+_CHECK_SQL = "SELECT ID FROM student WHERE ID = ?"
+_DELETE_SQL = "DELETE FROM student WHERE ID = ? RETURNING ID"
+_INSERT_SQL = (
+    "INSERT OR IGNORE INTO student ("
+    + ", ".join(COLUMNS)
+    + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_STRICT_SQL = (
+    "INSERT INTO student ("
+    + ", ".join(COLUMNS)
+    + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Seeds one subject_stats row per subject from the student table.
+_STATS_SEED_SQL = "".join(
+    f"INSERT OR REPLACE INTO subject_stats VALUES ('{subject}', "
+    f"(SELECT MIN({subject}) FROM student), "
+    f"(SELECT MAX({subject}) FROM student), "
+    f"(SELECT ROUND(AVG({subject}), 2) FROM student));"
+    for subject in SUBJECTS
+)
+
+# Trigger body recomputing every subject_stats row. Plain UPDATEs are
+# used because an outer INSERT OR IGNORE would override the conflict
+# policy of any INSERT inside the trigger and skip the refresh.
+_STATS_REFRESH_SQL = "".join(
+    f"UPDATE subject_stats SET "
+    f"min_score = (SELECT MIN({subject}) FROM student), "
+    f"max_score = (SELECT MAX({subject}) FROM student), "
+    f"avg_score = (SELECT ROUND(AVG({subject}), 2) FROM student) "
+    f"WHERE subject = '{subject}';"
+    for subject in SUBJECTS
+)
+
+
+def _to_iso_date(value: str | None) -> str | None:
+    """Converts an M-D-YYYY date string to ISO-8601 (YYYY-MM-DD).
+
+    Values that are not in M-D-YYYY form (e.g. already ISO, or None from
+    a partial insert) are returned unchanged.
+
+    Args:
+        value (str | None): The date string to convert.
+
+    Returns:
+        str | None: The ISO-8601 form of the date, or the original
+        value.
+    """
+    try:
+        return datetime.strptime(value, "%m-%d-%Y").date().isoformat()
+    except (TypeError, ValueError):
+        return value
+
 
 class StudentManager:
     """A class to manage student information stored in a SQLite database."""
@@ -35,70 +112,326 @@ class StudentManager:
             db_path (str): The file path to the SQLite database.
         """
         self.db_path = db_path
+        self._local = threading.local()
+        self._stats_cache: dict[str, dict[str, Any]] | None = None
+        self._stats_lock = threading.Lock()
+        self._update_sql_cache: dict[tuple, str] = {}
         self.create_tables()
 
     def connect(self) -> sqlite3.Connection:
-        """Establishes a connection to the SQLite database.
+        """Returns the cached per-thread connection to the SQLite database.
+
+        A connection is opened lazily once per thread and reused across
+        calls, so the file-open and PRAGMA cost is not paid per query. If
+        a caller closed the cached connection, a fresh one is opened. New
+        connections are tuned for speed: WAL journaling (persistent per
+        database file, but cheap to re-issue), relaxed fsync behaviour,
+        in-memory temp storage, a 64 MB page cache, and memory-mapped I/O.
 
         Returns:
             sqlite3.Connection: A connection object to the SQLite database.
         """
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                # The cached connection was closed by a caller.
+                conn = None
+        if conn is None:
+            # A larger prepared-statement cache keeps the repeated point
+            # lookups (WHERE ID = ?) compiled across calls.
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.executescript(
+                # page_size only takes effect on a fresh database and
+                # must be set before WAL is enabled.
+                "PRAGMA page_size=8192;"
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA mmap_size=268435456;"
+                "PRAGMA busy_timeout=5000;"
+            )
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Groups several operations into a single transaction.
+
+        Mutating methods called inside the block share one
+        BEGIN IMMEDIATE ... COMMIT instead of committing (and syncing to
+        disk) individually; everything rolls back if the block raises.
+
+        Yields:
+            sqlite3.Connection: The shared connection for the block.
+        """
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.in_transaction = True
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_transaction = False
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commits unless an enclosing transaction() block is active.
+
+        Args:
+            conn (sqlite3.Connection): The database connection object.
+        """
+        if not getattr(self._local, "in_transaction", False):
+            conn.commit()
+
+    def close(self) -> None:
+        """Closes this thread's cached database connection, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self) -> "StudentManager":
+        """Returns the manager for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Closes the cached connection when the context exits."""
+        self.close()
 
     def create_tables(self) -> None:
-        """Creates the tables in the database if they do not exist."""
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS student (
-                    ID TEXT PRIMARY KEY,
-                    Name TEXT,
-                    Gender TEXT,
-                    Enroll_Date TEXT,
-                    English TEXT,
-                    Math TEXT,
-                    History TEXT,
-                    Science TEXT,
-                    Arts TEXT
-                )
+        """Creates the tables in the database if they do not exist.
+
+        Grade columns are stored with INTEGER affinity so aggregates run
+        as native numeric operations instead of string comparisons, and
+        the table is WITHOUT ROWID so ID lookups traverse one B-tree
+        instead of an index plus a rowid table. Databases created with
+        the old all-TEXT schema are migrated in place.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS student (
+                ID TEXT PRIMARY KEY,
+                Name TEXT,
+                Gender TEXT,
+                Enroll_Date TEXT,
+                English INTEGER,
+                Math INTEGER,
+                History INTEGER,
+                Science INTEGER,
+                Arts INTEGER
+            ) WITHOUT ROWID
+        """)
+        self._migrate_text_grades(conn)
+        # Per-subject aggregates are precomputed into subject_stats and
+        # kept current by triggers, so reading them never scans the
+        # student table.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS subject_stats (
+                subject TEXT PRIMARY KEY,
+                min_score NUMERIC,
+                max_score NUMERIC,
+                avg_score NUMERIC
+            )
+        """)
+        self._create_stats_triggers(cursor)
+        cursor.executescript(_STATS_SEED_SQL)
+        conn.commit()
+
+    def _create_stats_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """Creates the triggers that keep subject_stats current.
+
+        Args:
+            cursor (sqlite3.Cursor): A cursor on the database connection.
+        """
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.executescript(f"""
+                CREATE TRIGGER IF NOT EXISTS student_stats_{event.lower()}
+                AFTER {event} ON student
+                BEGIN
+                    {_STATS_REFRESH_SQL}
+                END;
             """)
-            conn.commit()
+
+    def _drop_stats_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """Drops the subject_stats triggers, e.g. around a bulk load.
+
+        Args:
+            cursor (sqlite3.Cursor): A cursor on the database connection.
+        """
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(
+                f"DROP TRIGGER IF EXISTS student_stats_{event.lower()}"
+            )
+
+    def _migrate_text_grades(self, conn: sqlite3.Connection) -> None:
+        """Rebuilds the student table if grades are still declared TEXT.
+
+        Databases written by the old schema also carry M-D-YYYY
+        enrollment dates, which the ISO-only read path cannot parse, so
+        the migration normalizes them as well.
+
+        Args:
+            conn (sqlite3.Connection): The database connection object.
+        """
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(student)")
+        column_types = {row[1]: row[2] for row in cursor.fetchall()}
+        if column_types.get("English") == "INTEGER":
+            return
+        cursor.executescript("""
+            ALTER TABLE student RENAME TO student_old;
+            CREATE TABLE student (
+                ID TEXT PRIMARY KEY,
+                Name TEXT,
+                Gender TEXT,
+                Enroll_Date TEXT,
+                English INTEGER,
+                Math INTEGER,
+                History INTEGER,
+                Science INTEGER,
+                Arts INTEGER
+            ) WITHOUT ROWID;
+            INSERT INTO student SELECT * FROM student_old;
+            DROP TABLE student_old;
+        """)
+        self._normalize_dates(conn)
 
     def parse_data(self, student_filename: str) -> None:
         """Parses data from TSV files into the database.
 
+        The ingest only runs against an empty table; once the data has
+        been loaded (e.g. on a previous server start), the file is not
+        re-read and re-inserted.
+
         Args:
             student_filename (str): The file path of the TSV file containing
             student data.
         """
-        with self.connect() as conn, open(
-            student_filename, encoding="utf-8"
-        ) as student_file:
-            cursor = conn.cursor()
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM student LIMIT 1")
+        if cursor.fetchone() is not None:
+            return
+        # Rows are bound positionally and the CLI imports the file
+        # verbatim, so the header must match the table's column order;
+        # validated once here, before any path touches the table.
+        with open(student_filename, encoding="utf-8") as student_file:
+            first_line = student_file.readline()
+        headers = tuple(next(csv.reader([first_line], delimiter="\t"), ()))
+        if headers != COLUMNS:
+            raise ValueError(
+                f"Unexpected TSV header {list(headers)}; "
+                f"expected columns {list(COLUMNS)}"
+            )
+        # The stats triggers rescan the whole student table, so firing
+        # them for every inserted row would make a bulk load quadratic.
+        # They are dropped around the batch and the aggregates reseeded
+        # once at the end instead.
+        self._drop_stats_triggers(cursor)
+        conn.commit()
+        try:
+            if self._import_with_cli(student_filename):
+                return
+            if pd is not None:
+                # pandas parses the whole TSV in vectorized C; dtype=str
+                # keeps the values exactly as written so the rows feed
+                # the same transform as the stdlib path.
+                frame = pd.read_csv(student_filename, sep="\t", dtype=str)
+                records = frame.itertuples(index=False, name=None)
+            else:
+                # Slurp the whole file in one read and split it into
+                # lines in a single pass, instead of per-line buffered
+                # iteration; csv.reader then splits the fields in C.
+                with open(
+                    student_filename, encoding="utf-8"
+                ) as student_file:
+                    lines = student_file.read().splitlines()
+                reader = csv.reader(lines, delimiter="\t")
+                next(reader, None)  # skip the already validated header
+                records = (row for row in reader if row)
+            # Enrollment dates are stored in ISO-8601 so reads can use
+            # the fast datetime.fromisoformat instead of strptime.
+            rows = (
+                (row[0], row[1], row[2], _to_iso_date(row[3]), *row[4:])
+                for row in records
+            )
+            # One explicit transaction around the whole batch instead of
+            # one implicit transaction per statement.
+            conn.execute("BEGIN")
+            cursor.executemany(_INSERT_SQL, rows)
+            conn.commit()
+        finally:
+            # Runs unconditionally: a partially failed CLI import can
+            # commit some rows before the Python fallback takes over,
+            # and those rows still carry M-D-YYYY dates.
+            self._normalize_dates(conn)
+            self._create_stats_triggers(cursor)
+            cursor.executescript(_STATS_SEED_SQL)
+            conn.commit()
+            self._invalidate_stats()
+
+    def _import_with_cli(self, student_filename: str) -> bool:
+        """Bulk-loads a TSV file with the sqlite3 command-line shell.
+
+        The shell's .import command parses and inserts the file entirely
+        in C, bypassing Python. It is only attempted when the shell is
+        installed; otherwise the caller uses the Python ingest path,
+        which handles duplicates via INSERT OR IGNORE.
+
+        Args:
+            student_filename (str): The file path of the TSV file containing
+            student data.
+
+        Returns:
+            bool: True if the file was imported by the shell, False if the
+            caller should use the Python ingest path instead.
+        """
+        sqlite3_cli = shutil.which("sqlite3")
+        if sqlite3_cli is None:
+            return False
+        result = subprocess.run(
+            [
+                sqlite3_cli,
+                self.db_path,
+                "-cmd",
+                ".mode tabs",
+                f'.import --skip 1 "{student_filename}" student',
+            ],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0 and not result.stderr
+
+    def _normalize_dates(self, conn: sqlite3.Connection) -> None:
+        """Rewrites non-ISO enrollment dates to ISO-8601 form.
 
-            # Process student data
-            headers = student_file.readline().strip().split("\t")
-            for line in student_file:
-                values = line.strip().split("\t")
-                record = dict(zip(headers, values))
-                cursor.execute(
-                    """INSERT OR IGNORE INTO student (
-                        ID, Name, Gender, 
-                        Enroll_Date, English, Math, 
-                        History, Science, Arts
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        record["ID"],
-                        record["Name"],
-                        record["Gender"],
-                        record["Enroll_Date"],
-                        record["English"],
-                        record["Math"],
-                        record["History"],
-                        record["Science"],
-                        record["Arts"],
-                    ),
-                )
+        Used after every bulk ingest (the CLI path loads the TSV
+        verbatim, and a partially failed CLI import can leave verbatim
+        rows behind even when the Python path finishes the load) and
+        when migrating a database written by the old schema.
+
+        Args:
+            conn (sqlite3.Connection): The database connection object.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT ID, Enroll_Date FROM student "
+            "WHERE Enroll_Date NOT LIKE '____-__-__'"
+        )
+        fixes = [
+            (_to_iso_date(enroll_date), student_id)
+            for student_id, enroll_date in cursor.fetchall()
+        ]
+        if fixes:
+            cursor.executemany(
+                "UPDATE student SET Enroll_Date = ? WHERE ID = ?", fixes
+            )
             conn.commit()
 
     def get_student_by_id(self, student_id: str):
@@ -111,31 +444,78 @@ class StudentManager:
             dict or None: A dictionary of the student's details if found,
             otherwise None.
         """
-        with self.connect() as conn:
-            cursor = conn.cursor()
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute(_SELECT_ROW_SQL, (student_id,))
+        row = cursor.fetchone()
+        return dict(zip(COLUMNS, row, strict=True)) if row else None
+
+    def get_students_by_ids(self, student_ids: list) -> list:
+        """Fetches multiple students by their IDs.
+
+        The IDs are queried in chunks of 900 per IN (...) statement to
+        stay below SQLite's limit on bound variables, so arbitrarily
+        long ID lists are safe.
+
+        Args:
+            student_ids (list): The IDs of the students to fetch.
+
+        Returns:
+            list: A dictionary of details per student found; IDs with no
+            matching row are omitted.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        students: list[dict[str, Any]] = []
+        for start in range(0, len(student_ids), 900):
+            chunk = student_ids[start : start + 900]
+            placeholders = ", ".join("?" * len(chunk))
             cursor.execute(
-                """
-                SELECT ID, Name, Gender, Enroll_Date, English, Math, History, 
-                Science, Arts
-                FROM student
-                WHERE ID = ?
-            """,
-                (student_id,),
+                f"SELECT {', '.join(COLUMNS)} FROM student "
+                f"WHERE ID IN ({placeholders})",
+                chunk,
             )
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "ID": row[0],
-                    "Name": row[1],
-                    "Gender": row[2],
-                    "Enroll_Date": row[3],
-                    "English": row[4],
-                    "Math": row[5],
-                    "History": row[6],
-                    "Science": row[7],
-                    "Arts": row[8],
-                }
-        return None
+            students.extend(
+                dict(zip(COLUMNS, row, strict=True))
+                for row in cursor.fetchall()
+            )
+        return students
+
+    def _invalidate_stats(self) -> None:
+        """Drops the cached subject statistics after a write."""
+        with self._stats_lock:
+            self._stats_cache = None
+
+    def get_all_subject_stats(self) -> dict[str, dict[str, Any]]:
+        """Fetches min, max and average scores for every subject at once.
+
+        All fifteen aggregates come from the trigger-maintained
+        subject_stats table in a single SELECT, so the student table is
+        never scanned on the read path. The result is cached in memory
+        and only re-read after a write (insert, update, delete or
+        ingest) invalidates it.
+
+        Returns:
+            dict[str, dict[str, Any]]: Maps each subject name to a dict
+            with "min", "max" and "avg" keys. Values are None when the
+            table holds no scores.
+        """
+        with self._stats_lock:
+            if self._stats_cache is not None:
+                return self._stats_cache
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT subject, min_score, max_score, avg_score "
+            "FROM subject_stats"
+        )
+        stats = {
+            subject: {"min": minimum, "max": maximum, "avg": average}
+            for subject, minimum, maximum, average in cursor.fetchall()
+        }
+        with self._stats_lock:
+            self._stats_cache = stats
+        return stats
 
     def insert_student(self, student_data: dict) -> None:
         """Inserts a new student into the database.
@@ -146,47 +526,42 @@ class StudentManager:
                 'History', 'Science', 'Arts'.
 
         Raises:
-            ValueError: If any value in student_data has an invalid data type.
+            ValueError: If student_data names a field that is not a column
+            of the student table, or any value has an invalid data type.
         """
-        # Define the expected data types for each field
-
-        expected_types = {
-            "ID": str,
-            "Name": str,
-            "Gender": str,
-            "Enroll_Date": str,
-            "English": str,
-            "Math": str,
-            "History": str,
-            "Science": str,
-            "Arts": str,
-        }
-
-        # Validate the data types of the values
-        for key, value in student_data.items():
-            if not isinstance(value, expected_types[key]):
-                raise ValueError(
-                    f"Invalid data type for {key}: expected"
-                    f"{expected_types[key]}, got {type(value)}"
-                )
-        # Check if student ID already exists in the database
-        if self.check_student(student_data["ID"]):
-            raise sqlite3.IntegrityError(
-                f"UNIQUE constraint failed: student.ID for"
-                f"ID {student_data['ID']} already exists."
+        # Field names must match the table's columns exactly; every value
+        # arrives as a string (SQLite's column affinity converts the
+        # numeric ones on insert). One pass validates both.
+        unknown_key = next(
+            (key for key in student_data if key not in COLUMNS), None
+        )
+        if unknown_key is not None:
+            raise ValueError(f"Unknown student field: {unknown_key}")
+        invalid_key = next(
+            (
+                key
+                for key, value in student_data.items()
+                if not isinstance(value, str)
+            ),
+            None,
+        )
+        if invalid_key is not None:
+            raise ValueError(
+                f"Invalid data type for {invalid_key}: expected"
+                f"{str}, got {type(student_data[invalid_key])}"
             )
-            # If all data types are valid, insert the student into the database
-        with self.connect() as conn:
-            cursor = conn.cursor()
+        # The UNIQUE constraint on ID does the duplicate detection; no
+        # separate existence check is needed.
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
             cursor.execute(
-                "INSERT INTO student (ID, Name, Gender, Enroll_Date,"
-                "English, Math, History, Science, Arts) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _INSERT_STRICT_SQL,
                 (
                     student_data.get("ID"),
                     student_data.get("Name"),
                     student_data.get("Gender"),
-                    student_data.get("Enroll_Date"),
+                    _to_iso_date(student_data.get("Enroll_Date")),
                     student_data.get("English"),
                     student_data.get("Math"),
                     student_data.get("History"),
@@ -194,7 +569,18 @@ class StudentManager:
                     student_data.get("Arts"),
                 ),
             )
-            conn.commit()
+        except sqlite3.IntegrityError as error:
+            # Only duplicate IDs get the friendlier message; other
+            # integrity failures (e.g. a NULL ID hitting the NOT NULL
+            # primary key) propagate as-is.
+            if "UNIQUE constraint failed: student.ID" not in str(error):
+                raise
+            raise sqlite3.IntegrityError(
+                f"UNIQUE constraint failed: student.ID for "
+                f"ID {student_data['ID']} already exists."
+            ) from error
+        self._commit(conn)
+        self._invalidate_stats()
 
     def delete_student(self, student_id: str) -> bool:
         """Deletes a student from the database based on their ID.
@@ -205,27 +591,15 @@ class StudentManager:
         Returns:
             bool: True if the deletion was successful, False otherwise.
         """
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            # First, check if the student exists
-            cursor.execute(
-                "SELECT ID FROM student WHERE ID = ?", (student_id,)
-            )
-            if cursor.fetchone() is None:
-                return False
-
-            try:
-                cursor.execute(
-                    "DELETE FROM student WHERE ID = ?", (student_id,)
-                )
-                conn.commit()
-                # Verify that the student was deleted
-                cursor.execute(
-                    "SELECT ID FROM student WHERE ID = ?", (student_id,)
-                )
-                return cursor.fetchone() is None
-            except sqlite3.DatabaseError:
-                return False
+        conn = self.connect()
+        cursor = conn.cursor()
+        # A single DELETE ... RETURNING both removes the row and reports
+        # whether the student existed at all.
+        cursor.execute(_DELETE_SQL, (student_id,))
+        deleted = cursor.fetchone() is not None
+        self._commit(conn)
+        self._invalidate_stats()
+        return deleted
 
     def check_student(self, student_id: str) -> bool:
         """Checks if a student with the given ID exists in the database.
@@ -236,12 +610,10 @@ class StudentManager:
         Returns:
             bool: True if the student exists, False otherwise.
         """
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT ID FROM student WHERE ID = ?", (student_id,)
-            )
-            return cursor.fetchone() is not None
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.execute(_CHECK_SQL, (student_id,))
+        return cursor.fetchone() is not None
 
     def update_student(self, student_id: str, **updates: Any) -> bool:
         """Updates attributes for a specific student in the database.
@@ -252,37 +624,36 @@ class StudentManager:
             update.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
+            bool: True if a student with the given ID existed and the
+            update was applied, False otherwise.
         """
-        if not student_id:
+        if not student_id or not updates:
+            return False
+        # Only real column names may appear in the SET clause.
+        if any(key not in COLUMNS for key in updates):
             return False
 
-        with self.connect() as conn:
-            student = StudentList(conn, student_id)
-            if not student.student_id:
-                return False
-
-            # Prepare current values; ensure attribute names match
-            current_values = {
-                key: str(getattr(student, f"student_{key}", None))
-                for key in updates
-            }
-
-            # Check if any updates are actually needed
-            if all(
-                current_values.get(key) == str(updates[key]) for key in updates
-            ):
-                return False
-
-            # Proceed with the update if necessary
-            set_clause = ", ".join([f"{key} = ?" for key in updates])
-            values = list(updates.values())
-            values.append(student_id)
-            sql_query = f"UPDATE student SET {set_clause} WHERE ID = ?"
-            cursor = conn.cursor()
-            cursor.execute(sql_query, values)
-            conn.commit()
-            return True
+        conn = self.connect()
+        cursor = conn.cursor()
+        # A single UPDATE ... RETURNING applies the change and reports
+        # whether the student existed, with no read-back beforehand. The
+        # statement text is memoized per column set, so repeated updates
+        # of the same fields reuse one SQL string and its cached plan.
+        key = tuple(updates)
+        sql_query = self._update_sql_cache.get(key)
+        if sql_query is None:
+            set_clause = ", ".join([f"{column} = ?" for column in key])
+            sql_query = (
+                f"UPDATE student SET {set_clause} WHERE ID = ? RETURNING ID"
+            )
+            self._update_sql_cache[key] = sql_query
+        values = [updates[column] for column in key]
+        values.append(student_id)
+        cursor.execute(sql_query, values)
+        updated = cursor.fetchone() is not None
+        self._commit(conn)
+        self._invalidate_stats()
+        return updated
 
     def export_data(self, filename: str = "new_student.tsv") -> None:
         """Exports student data from the database to a TSV file.
@@ -291,21 +662,18 @@ class StudentManager:
             filename (str): The file path to save the exported data.
                 Defaults to "new_student.tsv".
         """
-        with self.connect() as conn, open(
-            filename, "w", newline="", encoding="utf-8"
+        conn = self.connect()
+        with open(
+            filename, "w", newline="", encoding="utf-8", buffering=1 << 20
         ) as file:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM student")
+            cursor.execute(_EXPORT_SQL)
             # Write header
-            file.write(
-                "\t".join(
-                    [description[0] for description in cursor.description]
-                )
-                + "\n"
-            )
-            # Write data
-            for row in cursor.fetchall():
-                file.write("\t".join(str(col) for col in row) + "\n")
+            file.write("\t".join(COLUMNS) + "\n")
+            # Each row arrives from SQLite already joined into a single
+            # tab-separated string; writelines drains the cursor lazily
+            # and the 1 MB file buffer batches the writes.
+            file.writelines(line + "\n" for (line,) in cursor)
 
         print("Data exported successfully to:", filename)
 
@@ -324,23 +692,35 @@ class StudentList:
         """
         self.students_id = students_id
         self.connection = connection
+        self._row: dict[str, Any] | None = None
 
     def _getattribute_(self, attribute: str) -> Any:
-        """Retrieve a specific attribute from the database for the student.
+        """Retrieve a specific attribute from the cached student row.
+
+        The whole row is fetched with a single SELECT on first access and
+        served from memory afterwards, instead of issuing one query per
+        attribute.
 
         Args:
             attribute (str): The attribute to retrieve from the database.
 
         Returns:
             Any: The value of the requested attribute.
+
+        Raises:
+            KeyError: If the attribute is not a column of the student
+            table.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            f"SELECT {attribute} FROM student WHERE ID = ?",
-            (self.students_id,),
-        )
-        result = cursor.fetchone()
-        return result[0] if result else None
+        if attribute not in COLUMNS:
+            raise KeyError(attribute)
+        if self._row is None:
+            cursor = self.connection.cursor()
+            cursor.execute(_SELECT_ROW_SQL, (self.students_id,))
+            result = cursor.fetchone()
+            self._row = (
+                dict(zip(COLUMNS, result, strict=True)) if result else {}
+            )
+        return self._row.get(attribute)
 
     @property
     def student_id(self) -> Any:
@@ -362,7 +742,7 @@ class StudentList:
         """Get the student's enrollment date."""
         datetime_string = self._getattribute_("Enroll_Date")
         return (
-            datetime.strptime(datetime_string, "%m-%d-%Y")
+            datetime.fromisoformat(datetime_string)
             if datetime_string
             else None
         )
@@ -396,10 +776,34 @@ class StudentList:
 class Grades:
     """Provides statistical calculations for student scores.
 
-    This class offers methods to calculate the maximum, minimum, and average
-    scores for a specific subject within a database of student records.
+    This class offers methods to look up the maximum, minimum, and average
+    scores for a specific subject. The values are precomputed into the
+    subject_stats table by triggers on the student table, so each lookup
+    is a single primary-key read instead of a table scan.
     """
 
+    @staticmethod
+    def get_stats(connection, subject: str) -> tuple:
+        """Look up min, max and average for a subject in one query.
+
+        Args:
+            connection (sqlite3.Connection): The database connection object.
+            subject (str): The subject name whose statistics are to be
+            looked up.
+
+        Returns:
+            tuple: A (min, max, avg) tuple for the subject; elements are
+            None when no scores are available.
+        """
+        cursor = connection.cursor()
+        cursor.execute(
+            "SELECT min_score, max_score, avg_score "
+            "FROM subject_stats WHERE subject = ?",
+            (subject,),
+        )
+        result = cursor.fetchone()
+        return result if result else (None, None, None)
+
     @staticmethod
     def get_max_score(connection, subject: str) -> int:
         """Retrieve the highest score for a specified subject.
@@ -412,10 +816,7 @@ class Grades:
             int or None: The highest score found in the subject, or None if no
             scores are available.
         """
-        cursor = connection.cursor()
-        cursor.execute(f"SELECT MAX({subject}) FROM student")
-        result = cursor.fetchone()
-        return (result[0]) if result[0] is not None else None
+        return Grades.get_stats(connection, subject)[1]
 
     @staticmethod
     def get_min_score(connection, subject: str) -> int:
@@ -429,26 +830,20 @@ class Grades:
             int or None: The lowest score found in the subject, or None if no
             scores are available.
         """
-        cursor = connection.cursor()
-        cursor.execute(f"SELECT MIN({subject}) FROM student")
-        result = cursor.fetchone()
-        return (result[0]) if result[0] is not None else None
+        return Grades.get_stats(connection, subject)[0]
 
     @staticmethod
     def get_avg_score(connection, subject: str) -> float:
-        """Calculate the average score for a specified subject.
+        """Look up the average score for a specified subject.
 
         Args:
             connection (sqlite3.Connection): The database connection object.
             subject (str): The subject name whose average score is to be
-            calculated.
+            looked up.
 
         Returns:
             float or None: The average score as a floating-point number
             rounded to two decimal places,
             or None if no scores are available.
         """
-        cursor = connection.cursor()
-        cursor.execute(f"SELECT AVG({subject}) FROM student")
-        result = cursor.fetchone()
-        return round(result[0], 2) if result[0] is not None else None
+        return Grades.get_stats(connection, subject)[2]
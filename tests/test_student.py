@@ -48,6 +48,7 @@ def student_manager(tmp_path: Path) -> Generator[StudentManager, None, None]:
     manager = StudentManager(str(db_path))
     manager.create_tables()
     yield manager
+    manager.close()
 
 
 # For the load_data fixture
@@ -65,26 +66,23 @@ def test_student_data_insertion(
 ) -> None:
     """Verifies that student data is correctly inserted into the database."""
     conn = student_manager.connect()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM student WHERE ID = \
-                '53821'"
-        )
-        result = cursor.fetchone()
-        assert result == (
-            "53821",
-            "Walt",
-            "Male",
-            "9-1-2022",
-            "78",
-            "93",
-            "86",
-            "95",
-            "88",
-        ), "Student data insertion failed or data corrupted"
-    finally:
-        conn.close()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT * FROM student WHERE ID = \
+            '53821'"
+    )
+    result = cursor.fetchone()
+    assert result == (
+        "53821",
+        "Walt",
+        "Male",
+        "2022-09-01",
+        78,
+        93,
+        86,
+        95,
+        88,
+    ), "Student data insertion failed or data corrupted"
 
 
 def test_insert_and_retrieve_complete_data(
@@ -92,23 +90,17 @@ def test_insert_and_retrieve_complete_data(
 ) -> None:
     """Tests full retrieval of a student's data using the StudentList class."""
     conn = student_manager.connect()
-    try:
-        student_list = StudentList(connection=conn, students_id="53821")
-        assert student_list.student_name == "Walt", "Name retrieval failed"
-    finally:
-        conn.close()
+    student_list = StudentList(connection=conn, students_id="53821")
+    assert student_list.student_name == "Walt", "Name retrieval failed"
 
 
 def test_invalid_student_id(student_manager: StudentManager) -> None:
     """Tests handling of non-existent student ID."""
     conn = student_manager.connect()
-    try:
-        student_list = StudentList(connection=conn, students_id="99999")
-        assert (
-            student_list.student_name is None
-        ), "Should return None for non-existent student ID"
-    finally:
-        conn.close()
+    student_list = StudentList(connection=conn, students_id="99999")
+    assert (
+        student_list.student_name is None
+    ), "Should return None for non-existent student ID"
 
 
 def test_insert_invalid_data_types(student_manager: StudentManager) -> None:
@@ -129,15 +121,12 @@ def test_insert_invalid_data_types(student_manager: StudentManager) -> None:
     student_manager.insert_student(invalid_data)
     # Check if data is inserted
     conn = student_manager.connect()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT ID FROM student WHERE ID = '9999'")
-        result = cursor.fetchone()
-        assert (
-            result is not None
-        ), "Data should be inserted even with invalid types"
-    finally:
-        conn.close()
+    cursor = conn.cursor()
+    cursor.execute("SELECT ID FROM student WHERE ID = '9999'")
+    result = cursor.fetchone()
+    assert (
+        result is not None
+    ), "Data should be inserted even with invalid types"
 
 
 def test_update_student_record(
@@ -152,13 +141,8 @@ def test_update_student_record(
 
     # Verify the updated data
     conn = student_manager.connect()
-    try:
-        student_list = StudentList(connection=conn, students_id="53821")
-        assert (
-            student_list.student_english == "85"
-        ), "English grade update failed"
-    finally:
-        conn.close()
+    student_list = StudentList(connection=conn, students_id="53821")
+    assert student_list.student_english == 85, "English grade update failed"
 
 
 def test_delete_student_record(
@@ -170,11 +154,8 @@ def test_delete_student_record(
 
     # Verify that the student is deleted
     conn = student_manager.connect()
-    try:
-        student_list = StudentList(connection=conn, students_id="53821")
-        assert student_list.student_id is None, "Student should be deleted"
-    finally:
-        conn.close()
+    student_list = StudentList(connection=conn, students_id="53821")
+    assert student_list.student_id is None, "Student should be deleted"
 
 
 def test_invalid_update_student_record(
@@ -198,17 +179,53 @@ def test_invalid_delete_student_record(
     ), "Deletion should fail for non-existent student"
 
 
-def test_export_data(student_manager: StudentManager, tmp_path: Path) -> None:
+def test_transaction_commits_batch(
+    student_manager: StudentManager, load_data: None
+) -> None:
+    """Tests that grouped operations inside transaction() all commit."""
+    with student_manager.transaction():
+        student_manager.update_student("53821", English="70")
+        assert student_manager.delete_student("76936"), "Deletion failed"
+    assert not student_manager.check_student(
+        "76936"
+    ), "Deleted student should stay deleted after the block"
+
+
+def test_transaction_rolls_back_on_error(
+    student_manager: StudentManager, load_data: None
+) -> None:
+    """Tests that transaction() rolls everything back when the block raises."""
+    with pytest.raises(RuntimeError):  # noqa: SIM117
+        with student_manager.transaction():
+            student_manager.delete_student("53821")
+            raise RuntimeError("boom")
+    assert student_manager.check_student(
+        "53821"
+    ), "Delete inside a failed transaction should be rolled back"
+
+
+def test_export_data(
+    student_manager: StudentManager, load_data: None, tmp_path: Path
+) -> None:
     """Tests exporting student data to a TSV file."""
+    # A partially filled student exercises NULL handling in the export
+    student_manager.insert_student({"ID": "11111", "Name": "Nia"})
+
     # Call the export_data function
     filename = tmp_path / "test_export.tsv"
     student_manager.export_data(str(filename))
 
-    # Check if the file has been created
-    assert filename.exists(), "Exported file does not exist"
-
-    # Check if the file is not empty
-    assert filename.stat().st_size > 0, "Exported file is empty"
+    # Check the exported content, not just that a file appeared
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    header = "ID\tName\tGender\tEnroll_Date\tEnglish\tMath"
+    header += "\tHistory\tScience\tArts"
+    assert lines[0] == header, "Exported header is wrong"
+    assert (
+        "53821\tWalt\tMale\t2022-09-01\t78\t93\t86\t95\t88" in lines
+    ), "Exported rows do not match the database contents"
+    assert (
+        "11111\tNia\t\t\t\t\t\t\t" in lines
+    ), "NULL columns should export as empty fields"
 
 
 def test_max_score_calculation(
@@ -216,14 +233,11 @@ def test_max_score_calculation(
 ) -> None:
     """Tests the calculation of the maximum score for a specific subject."""
     conn = student_manager.connect()
-    try:
-        max_score = Grades.get_max_score(conn, "Math")
-        expected_max_score = 99
-        assert (
-            int(max_score) == expected_max_score
-        ), f"Expected {expected_max_score}, got {max_score}"
-    finally:
-        conn.close()
+    max_score = Grades.get_max_score(conn, "Math")
+    expected_max_score = 99
+    assert (
+        int(max_score) == expected_max_score
+    ), f"Expected {expected_max_score}, got {max_score}"
 
 
 def test_min_score_calculation(
@@ -231,14 +245,45 @@ def test_min_score_calculation(
 ) -> None:
     """Tests the calculation of the minimum score for a specific subject."""
     conn = student_manager.connect()
-    try:
-        min_score = Grades.get_min_score(conn, "Math")
-        expected_min_score = 77
-        assert (
-            int(min_score) == expected_min_score
-        ), f"Expected {expected_min_score}, got {min_score}"
-    finally:
-        conn.close()
+    min_score = Grades.get_min_score(conn, "Math")
+    expected_min_score = 77
+    assert (
+        int(min_score) == expected_min_score
+    ), f"Expected {expected_min_score}, got {min_score}"
+
+
+def test_get_students_by_ids(
+    student_manager: StudentManager, load_data: None
+) -> None:
+    """Tests fetching several students at once by their IDs."""
+    students = student_manager.get_students_by_ids(
+        ["53821", "76936", "99999"]
+    )
+    names = {student["Name"] for student in students}
+    assert names == {"Walt", "Ush"}, "Bulk lookup returned wrong students"
+
+
+def test_get_all_subject_stats(
+    student_manager: StudentManager, load_data: None
+) -> None:
+    """Tests fetching all subject statistics in a single query."""
+    stats = student_manager.get_all_subject_stats()
+    assert int(stats["Math"]["max"]) == 99, "Math max score incorrect"
+    assert int(stats["Math"]["min"]) == 77, "Math min score incorrect"
+    assert float(stats["Math"]["avg"]) == 88.2, "Math avg score incorrect"
+
+
+def test_get_stats(
+    student_manager: StudentManager, load_data: None
+) -> None:
+    """Tests fetching a subject's min, max and average in one call."""
+    conn = student_manager.connect()
+    minimum, maximum, average = Grades.get_stats(conn, "Math")
+    assert (int(minimum), int(maximum), float(average)) == (
+        77,
+        99,
+        88.2,
+    ), "Math statistics incorrect"
 
 
 def test_avg_score_calculation(
@@ -246,11 +291,8 @@ def test_avg_score_calculation(
 ) -> None:
     """Tests the calculation of the average score for a specific subject."""
     conn = student_manager.connect()
-    try:
-        avg_score = Grades.get_avg_score(conn, "Math")
-        expected_avg_score = 88.2
-        assert (
-            float(avg_score) == expected_avg_score
-        ), f"Expected {expected_avg_score}, got {avg_score}"
-    finally:
-        conn.close()
+    avg_score = Grades.get_avg_score(conn, "Math")
+    expected_avg_score = 88.2
+    assert (
+        float(avg_score) == expected_avg_score
+    ), f"Expected {expected_avg_score}, got {avg_score}"